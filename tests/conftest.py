@@ -0,0 +1,137 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import json
+import os
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from src.app import activities, app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a single test client for the FastAPI app, shared by the whole session
+
+    Entering the client as a context manager runs the app's startup and
+    shutdown once and keeps one HTTPX transport for every request, so tests
+    should use this fixture rather than instantiating their own TestClient.
+    """
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest_asyncio.fixture(scope="session")
+async def aclient():
+    """Create a single async client for the FastAPI app, shared by the whole session
+
+    Requests go straight through ASGITransport on the event loop, without the
+    thread portal TestClient uses, so batches can be issued with asyncio.gather.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def _pristine_activities():
+    """Initial activity data, checked once per session against the app's defaults"""
+    expected = {
+        "Soccer Team": {
+            "description": "Join our competitive soccer team and represent the school",
+            "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
+            "max_participants": 25,
+            "participants": ["alex@mergington.edu", "sarah@mergington.edu"]
+        },
+        "Basketball Club": {
+            "description": "Practice basketball skills and play friendly matches",
+            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
+            "max_participants": 15,
+            "participants": ["james@mergington.edu"]
+        },
+        "Art Club": {
+            "description": "Express creativity through painting, drawing, and sculpture",
+            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+            "max_participants": 18,
+            "participants": ["lucy@mergington.edu", "david@mergington.edu"]
+        },
+        "Drama Society": {
+            "description": "Participate in theatrical productions and improve acting skills",
+            "schedule": "Fridays, 4:00 PM - 6:00 PM",
+            "max_participants": 20,
+            "participants": ["anna@mergington.edu"]
+        },
+        "Debate Club": {
+            "description": "Develop critical thinking and public speaking through structured debates",
+            "schedule": "Thursdays, 3:30 PM - 5:00 PM",
+            "max_participants": 16,
+            "participants": ["robert@mergington.edu", "maria@mergington.edu"]
+        },
+        "Science Olympiad": {
+            "description": "Compete in scientific challenges and experiments",
+            "schedule": "Saturdays, 10:00 AM - 12:00 PM",
+            "max_participants": 24,
+            "participants": ["kevin@mergington.edu", "jennifer@mergington.edu", "thomas@mergington.edu"]
+        },
+        "Chess Club": {
+            "description": "Learn strategies and compete in chess tournaments",
+            "schedule": "Fridays, 3:30 PM - 5:00 PM",
+            "max_participants": 12,
+            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        },
+        "Programming Class": {
+            "description": "Learn programming fundamentals and build software projects",
+            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+            "max_participants": 20,
+            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        },
+        "Gym Class": {
+            "description": "Physical education and sports activities",
+            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+            "max_participants": 30,
+            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        }
+    }
+    assert activities == expected, "src.app.activities no longer matches the expected initial data"
+    blob = json.dumps(expected)
+
+    yield expected
+
+    # Leave the app's data pristine once the session is over
+    activities.clear()
+    activities.update(json.loads(blob))
+
+
+@pytest.fixture
+def reset_activities(_pristine_activities):
+    """Reset participant lists to their initial state before each test
+
+    The endpoints only ever mutate ``participants``, so only those lists are
+    restored. There is no teardown: the next test's setup resets them again and
+    ``_pristine_activities`` restores the full data when the session ends.
+    """
+    for name, activity in _pristine_activities.items():
+        activities[name]["participants"] = list(activity["participants"])
+
+
+@pytest.fixture
+def email_ns():
+    """Build emails tagged with the pytest-xdist worker id, if any
+
+    Each xdist worker already has its own copy of ``src.app.activities``, so
+    this is not needed for isolation under ``-n auto``; it only makes the
+    worker that created an email visible in failure output. Serial runs get
+    plain, untagged emails.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    suffix = f"-{worker}" if worker else ""
+    return lambda name: f"{name}{suffix}@mergington.edu"
+
+
+@pytest.fixture
+def participants():
+    """Read an activity's participants straight from the app's state, skipping a GET round-trip"""
+    return lambda activity: activities[activity]["participants"]
@@ -2,89 +2,11 @@
 Test suite for the Mergington High School Activities API
 """
 
-import pytest
-from fastapi.testclient import TestClient
-from src.app import app
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+import asyncio
 
+import pytest
 
-@pytest.fixture
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    from src.app import activities
-    
-    # Store original state
-    original_activities = {
-        "Soccer Team": {
-            "description": "Join our competitive soccer team and represent the school",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
-            "max_participants": 25,
-            "participants": ["alex@mergington.edu", "sarah@mergington.edu"]
-        },
-        "Basketball Club": {
-            "description": "Practice basketball skills and play friendly matches",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu"]
-        },
-        "Art Club": {
-            "description": "Express creativity through painting, drawing, and sculpture",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["lucy@mergington.edu", "david@mergington.edu"]
-        },
-        "Drama Society": {
-            "description": "Participate in theatrical productions and improve acting skills",
-            "schedule": "Fridays, 4:00 PM - 6:00 PM",
-            "max_participants": 20,
-            "participants": ["anna@mergington.edu"]
-        },
-        "Debate Club": {
-            "description": "Develop critical thinking and public speaking through structured debates",
-            "schedule": "Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["robert@mergington.edu", "maria@mergington.edu"]
-        },
-        "Science Olympiad": {
-            "description": "Compete in scientific challenges and experiments",
-            "schedule": "Saturdays, 10:00 AM - 12:00 PM",
-            "max_participants": 24,
-            "participants": ["kevin@mergington.edu", "jennifer@mergington.edu", "thomas@mergington.edu"]
-        },
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
-    
-    # Reset to original state
-    activities.clear()
-    activities.update(original_activities)
-    
-    yield
-    
-    # Clean up after test
-    activities.clear()
-    activities.update(original_activities)
+pytestmark = pytest.mark.integration
 
 
 class TestRootEndpoint:
@@ -135,75 +57,36 @@ class TestActivitiesEndpoint:
 class TestSignupEndpoint:
     """Test the signup endpoint"""
     
-    def test_signup_success(self, client, reset_activities):
-        """Test successful signup for an activity"""
-        email = "newstudent@mergington.edu"
-        activity = "Soccer Team"
-        
-        response = client.post(f"/activities/{activity}/signup", params={"email": email})
+    @pytest.mark.parametrize("activity_url,activity_key,email", [
+        ("Soccer Team", "Soccer Team", "newstudent@mergington.edu"),
+        ("Chess Club", "Chess Club", "test+user@mergington.edu"),
+        ("Soccer Team", "Soccer Team", "a" * 100 + "@mergington.edu"),
+        ("Soccer Team", "Soccer Team", "tëst@mergington.edu"),
+    ])
+    def test_signup_success(self, client, reset_activities, participants, activity_url, activity_key, email):
+        """Test successful signup across activity names and email formats"""
+        response = client.post(f"/activities/{activity_url}/signup", params={"email": email})
         assert response.status_code == 200
         
         data = response.json()
         assert "message" in data
         assert email in data["message"]
-        assert activity in data["message"]
-        
-        # Verify the participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
-    
-    def test_signup_duplicate_participant(self, client, reset_activities):
-        """Test signup fails when student is already registered"""
-        email = "alex@mergington.edu"  # Already in Soccer Team
-        activity = "Soccer Team"
-        
-        response = client.post(f"/activities/{activity}/signup", params={"email": email})
-        assert response.status_code == 400
-        
-        data = response.json()
-        assert "detail" in data
-        assert "already signed up" in data["detail"]
-    
-    def test_signup_nonexistent_activity(self, client, reset_activities):
-        """Test signup fails for non-existent activity"""
-        email = "student@mergington.edu"
-        activity = "Nonexistent Club"
-        
-        response = client.post(f"/activities/{activity}/signup", params={"email": email})
-        assert response.status_code == 404
-        
-        data = response.json()
-        assert "detail" in data
-        assert "Activity not found" in data["detail"]
-    
-    def test_signup_url_encoded_activity_name(self, client, reset_activities):
-        """Test signup works with URL-encoded activity names"""
-        email = "student@mergington.edu"
-        activity = "Art Club"
-        encoded_activity = "Art%20Club"
-        
-        response = client.post(f"/activities/{encoded_activity}/signup", params={"email": email})
-        assert response.status_code == 200
+        assert activity_key in data["message"]
         
         # Verify the participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
+        assert email in participants(activity_key)
 
 
 class TestUnregisterEndpoint:
     """Test the unregister endpoint"""
     
-    def test_unregister_success(self, client, reset_activities):
+    def test_unregister_success(self, client, reset_activities, participants):
         """Test successful unregistration from an activity"""
         email = "alex@mergington.edu"  # Existing participant in Soccer Team
         activity = "Soccer Team"
         
         # Verify participant is initially there
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
+        assert email in participants(activity)
         
         # Unregister
         response = client.delete(f"/activities/{activity}/unregister", params={"email": email})
@@ -215,53 +98,50 @@ class TestUnregisterEndpoint:
         assert activity in data["message"]
         
         # Verify the participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity]["participants"]
-    
-    def test_unregister_not_registered(self, client, reset_activities):
-        """Test unregister fails when student is not registered"""
-        email = "notregistered@mergington.edu"
-        activity = "Soccer Team"
-        
-        response = client.delete(f"/activities/{activity}/unregister", params={"email": email})
-        assert response.status_code == 400
-        
-        data = response.json()
-        assert "detail" in data
-        assert "not signed up" in data["detail"]
+        assert email not in participants(activity)
+
+
+class TestErrorResponses:
+    """Test signup and unregister error responses"""
     
-    def test_unregister_nonexistent_activity(self, client, reset_activities):
-        """Test unregister fails for non-existent activity"""
-        email = "student@mergington.edu"
-        activity = "Nonexistent Club"
+    @pytest.mark.parametrize("method,activity,email,status,needle", [
+        ("POST", "Nonexistent Club", "student@mergington.edu", 404, "Activity not found"),
+        ("DELETE", "Nonexistent Club", "student@mergington.edu", 404, "Activity not found"),
+    ])
+    def test_error_paths(self, client, reset_activities, method, activity, email, status, needle):
+        """Test unknown activities surface as 404 responses over HTTP (other errors: test_handlers.py)"""
+        action = "signup" if method == "POST" else "unregister"
         
-        response = client.delete(f"/activities/{activity}/unregister", params={"email": email})
-        assert response.status_code == 404
+        response = client.request(method, f"/activities/{activity}/{action}", params={"email": email})
+        assert response.status_code == status
         
         data = response.json()
         assert "detail" in data
-        assert "Activity not found" in data["detail"]
+        assert needle in data["detail"]
+
+
+class TestUrlEncodedActivityName:
+    """Test endpoints with activity names that need URL encoding"""
     
-    def test_unregister_url_encoded_activity_name(self, client, reset_activities):
-        """Test unregister works with URL-encoded activity names"""
-        email = "lucy@mergington.edu"  # Existing participant in Art Club
-        activity = "Art Club"
-        encoded_activity = "Art%20Club"
+    @pytest.mark.parametrize("method,url_activity,state_activity,email", [
+        ("POST", "Art%20Club", "Art Club", "test@mergington.edu"),
+        ("DELETE", "Art%20Club", "Art Club", "lucy@mergington.edu"),  # Existing participant in Art Club
+    ])
+    def test_url_encoded_activity(self, client, reset_activities, participants, method, url_activity, state_activity, email):
+        """Test signup/unregister work with URL-encoded activity names"""
+        action = "signup" if method == "POST" else "unregister"
         
-        response = client.delete(f"/activities/{encoded_activity}/unregister", params={"email": email})
+        response = client.request(method, f"/activities/{url_activity}/{action}", params={"email": email})
         assert response.status_code == 200
         
-        # Verify the participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity]["participants"]
+        # Verify the decoded activity was updated
+        assert (email in participants(state_activity)) == (method == "POST")
 
 
 class TestSignupUnregisterIntegration:
     """Test signup and unregister working together"""
     
-    def test_signup_then_unregister(self, client, reset_activities):
+    def test_signup_then_unregister(self, client, reset_activities, participants):
         """Test complete flow of signing up and then unregistering"""
         email = "testflow@mergington.edu"
         activity = "Drama Society"
@@ -271,20 +151,16 @@ class TestSignupUnregisterIntegration:
         assert signup_response.status_code == 200
         
         # Verify signup
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
+        assert email in participants(activity)
         
         # Unregister
         unregister_response = client.delete(f"/activities/{activity}/unregister", params={"email": email})
         assert unregister_response.status_code == 200
         
         # Verify unregistration
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity]["participants"]
+        assert email not in participants(activity)
     
-    def test_signup_after_unregister(self, client, reset_activities):
+    def test_signup_after_unregister(self, client, reset_activities, participants):
         """Test that a student can sign up again after unregistering"""
         email = "sarah@mergington.edu"  # Existing participant in Soccer Team
         activity = "Soccer Team"
@@ -298,32 +174,18 @@ class TestSignupUnregisterIntegration:
         assert signup_response.status_code == 200
         
         # Verify re-signup
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
+        assert email in participants(activity)
 
 
 class TestEmailValidation:
     """Test email parameter handling"""
     
-    def test_signup_with_special_characters_in_email(self, client, reset_activities):
-        """Test signup with email containing special characters"""
-        email = "test+user@mergington.edu"
-        activity = "Chess Club"
-        
-        response = client.post(f"/activities/{activity}/signup", params={"email": email})
-        assert response.status_code == 200
-        
-        # Verify the participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
-    
-    def test_unregister_with_special_characters_in_email(self, client, reset_activities):
-        """Test unregister with email containing special characters"""
-        email = "test+user@mergington.edu"
-        activity = "Chess Club"
-        
+    @pytest.mark.parametrize("activity,email", [
+        ("Chess Club", "test+user@mergington.edu"),
+        ("Soccer Team", "tëst@mergington.edu"),
+    ])
+    def test_unregister_with_special_characters_in_email(self, client, reset_activities, participants, activity, email):
+        """Test unregister with email containing special or unicode characters"""
         # First signup
         client.post(f"/activities/{activity}/signup", params={"email": email})
         
@@ -332,39 +194,36 @@ class TestEmailValidation:
         assert response.status_code == 200
         
         # Verify removal
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity]["participants"]
+        assert email not in participants(activity)
 
 
 class TestDataPersistence:
     """Test that data changes persist across requests"""
     
-    def test_multiple_signups_persist(self, client, reset_activities):
+    async def test_multiple_signups_persist(self, aclient, reset_activities, participants):
         """Test that multiple signups are all preserved"""
         emails = ["student1@mergington.edu", "student2@mergington.edu", "student3@mergington.edu"]
         activity = "Programming Class"
         
-        # Sign up multiple students
-        for email in emails:
-            response = client.post(f"/activities/{activity}/signup", params={"email": email})
+        # Sign up multiple students concurrently
+        signup_url = f"/activities/{activity}/signup"
+        responses = await asyncio.gather(*[
+            aclient.post(signup_url, params={"email": email})
+            for email in emails
+        ])
+        for response in responses:
             assert response.status_code == 200
         
         # Verify all are present
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        
         for email in emails:
-            assert email in activities_data[activity]["participants"]
+            assert email in participants(activity)
     
-    def test_mixed_operations_persist(self, client, reset_activities):
+    def test_mixed_operations_persist(self, client, reset_activities, participants):
         """Test that mixed signup/unregister operations work correctly"""
         activity = "Science Olympiad"
         
         # Get initial participants
-        initial_response = client.get("/activities")
-        initial_data = initial_response.json()
-        initial_participants = set(initial_data[activity]["participants"])
+        initial_participants = set(participants(activity))
         
         # Add new participant
         new_email = "newscience@mergington.edu"
@@ -375,9 +234,7 @@ class TestDataPersistence:
         client.delete(f"/activities/{activity}/unregister", params={"email": existing_email})
         
         # Verify final state
-        final_response = client.get("/activities")
-        final_data = final_response.json()
-        final_participants = set(final_data[activity]["participants"])
+        final_participants = set(participants(activity))
         
         expected_participants = (initial_participants - {existing_email}) | {new_email}
         assert final_participants == expected_participants
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Unit tests calling the activity endpoint handlers directly, without the ASGI stack
+"""
+
+import pytest
+from fastapi import HTTPException
+from src.app import signup_for_activity, unregister_from_activity
+
+
+class TestSignupHandler:
+    """Test signup_for_activity business logic"""
+    
+    def test_signup_duplicate_participant(self, reset_activities):
+        """Test signup fails when student is already registered"""
+        with pytest.raises(HTTPException) as exc_info:
+            signup_for_activity("Soccer Team", "alex@mergington.edu")
+        assert exc_info.value.status_code == 400
+        assert "already signed up" in exc_info.value.detail
+    
+    def test_signup_nonexistent_activity(self, reset_activities):
+        """Test signup fails for non-existent activity"""
+        with pytest.raises(HTTPException) as exc_info:
+            signup_for_activity("Nonexistent Club", "student@mergington.edu")
+        assert exc_info.value.status_code == 404
+        assert "Activity not found" in exc_info.value.detail
+    
+    def test_no_duplicate_participants(self, reset_activities, participants):
+        """Test that a participant cannot be added twice"""
+        email = "duplicate@mergington.edu"
+        activity = "Basketball Club"
+        
+        signup_for_activity(activity, email)
+        with pytest.raises(HTTPException) as exc_info:
+            signup_for_activity(activity, email)
+        assert exc_info.value.status_code == 400
+        
+        # Verify only one instance exists
+        assert participants(activity).count(email) == 1
+
+
+class TestUnregisterHandler:
+    """Test unregister_from_activity business logic"""
+    
+    def test_unregister_not_registered(self, reset_activities):
+        """Test unregister fails when student is not registered"""
+        with pytest.raises(HTTPException) as exc_info:
+            unregister_from_activity("Soccer Team", "notregistered@mergington.edu")
+        assert exc_info.value.status_code == 400
+        assert "not signed up" in exc_info.value.detail
+    
+    def test_unregister_nonexistent_activity(self, reset_activities):
+        """Test unregister fails for non-existent activity"""
+        with pytest.raises(HTTPException) as exc_info:
+            unregister_from_activity("Nonexistent Club", "student@mergington.edu")
+        assert exc_info.value.status_code == 404
+        assert "Activity not found" in exc_info.value.detail
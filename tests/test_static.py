@@ -3,54 +3,44 @@ Test suite for static file serving
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app
 
+pytestmark = pytest.mark.integration
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+STATIC_ASSETS = ["/static/index.html", "/static/styles.css", "/static/app.js"]
+
+
+@pytest.fixture(scope="class")
+def static_assets(client):
+    """Fetch each static asset once and share the responses across the class"""
+    return {path: client.get(path) for path in STATIC_ASSETS}
 
 
 class TestStaticFiles:
     """Test static file serving"""
     
-    def test_static_index_html_accessible(self, client):
-        """Test that the main HTML file is accessible"""
-        response = client.get("/static/index.html")
+    @pytest.mark.parametrize("path,ctype,needles", [
+        ("/static/index.html", "text/html",
+         (b"Mergington High School", b"Extracurricular Activities", b"Sign Up for an Activity")),
+        ("/static/styles.css", "text/css",
+         (b"activity-card", b"participants-list", b"delete-icon")),
+        ("/static/app.js", ("javascript", "text/plain"),
+         (b"fetchActivities", b"unregisterParticipant", b"signup-form")),
+    ])
+    def test_static_asset(self, static_assets, path, ctype, needles):
+        """Test that static assets are served with the right type and key content"""
+        response = static_assets[path]
         assert response.status_code == 200
-        assert "text/html" in response.headers.get("content-type", "")
         
-        # Check for key content
-        content = response.text
-        assert "Mergington High School" in content
-        assert "Extracurricular Activities" in content
-        assert "Sign Up for an Activity" in content
-    
-    def test_static_css_accessible(self, client):
-        """Test that CSS file is accessible"""
-        response = client.get("/static/styles.css")
-        assert response.status_code == 200
-        assert "text/css" in response.headers.get("content-type", "")
-        
-        # Check for key CSS classes
-        content = response.text
-        assert "activity-card" in content
-        assert "participants-list" in content
-        assert "delete-icon" in content
-    
-    def test_static_js_accessible(self, client):
-        """Test that JavaScript file is accessible"""
-        response = client.get("/static/app.js")
-        assert response.status_code == 200
-        assert "javascript" in response.headers.get("content-type", "") or "text/plain" in response.headers.get("content-type", "")
+        content_type = response.headers.get("content-type", "")
+        if isinstance(ctype, tuple):
+            assert any(c in content_type for c in ctype)
+        else:
+            assert ctype in content_type
         
-        # Check for key functions
-        content = response.text
-        assert "fetchActivities" in content
-        assert "unregisterParticipant" in content
-        assert "signup-form" in content
+        # Check for key content on the raw bytes, without decoding the body
+        content = response.content
+        for needle in needles:
+            assert needle in content
     
     def test_static_nonexistent_file(self, client):
         """Test that non-existent static files return 404"""
@@ -63,5 +53,5 @@ class TestStaticFiles:
         assert response.status_code == 200
         
         # Should end up at the HTML page
-        content = response.text
-        assert "Mergington High School" in content
\ No newline at end of file
+        content = response.content
+        assert b"Mergington High School" in content
\ No newline at end of file